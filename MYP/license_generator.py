@@ -8,6 +8,7 @@ The license is stored in an encrypted JSON file that can be uploaded to GitHub f
 
 import json
 import datetime
+import functools
 import hashlib
 import uuid
 import os
@@ -15,22 +16,66 @@ import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from cryptography.fernet import Fernet
-from ttkthemes import ThemedTk
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 # Hardcoded Fernet key (must match LicenseManager)
 FERNET_KEY = b'gT5zX8Kj9LmN2QwP7RvY4SuB6TxA0VcE1UdF3WgH8Jk='
 
+# hashlib's sha256 is backed by OpenSSL (SHA-NI accelerated where the CPU supports it)
+_sha256 = hashlib.sha256
+_KEY_SEPARATOR = b":"
+
+
+def json_dumps(obj, indent=False):
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_dump(obj, f, indent=False):
+    """Write obj as JSON to the binary file f without building the whole document first."""
+    if orjson is not None:
+        f.write(json_dumps(obj, indent))
+        return
+    encoder = json.JSONEncoder(indent=2) if indent else json.JSONEncoder(separators=(",", ":"))
+    f.writelines(chunk.encode() for chunk in encoder.iterencode(obj))
+
+
+def json_loads(data):
+    """Deserialize JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
 def get_mac_address():
     """Get the MAC address of the current machine."""
     mac = uuid.getnode()
-    return ':'.join(['{:02x}'.format((mac >> elements) & 0xff) for elements in range(0, 8*6, 8)][::-1])
+    return mac.to_bytes(6, "big").hex(":")
+
+
+@functools.lru_cache(maxsize=32)
+def get_machine_id(mac_address):
+    """Get the machine ID recorded for the given MAC address."""
+    return hashlib.md5(mac_address.encode()).hexdigest()
 
 
 def generate_license_key(mac_address, customer_name):
     """Generate a deterministic license key based on MAC address and customer name."""
-    combined = f"{mac_address}:{customer_name}"
-    return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    h = _sha256()
+    h.update(mac_address.encode("ascii"))
+    h.update(_KEY_SEPARATOR)
+    h.update(customer_name.encode("utf-8"))
+    # Only the first 8 bytes (16 hex chars) form the key; hex-encode just those.
+    return h.digest()[:8].hex()
 
 
 def ensure_directory_exists(file_path):
@@ -40,6 +85,32 @@ def ensure_directory_exists(file_path):
         os.makedirs(directory, exist_ok=True)
 
 
+def file_stamp(path):
+    """Return (inode, size, mtime_ns) identifying the current contents of path, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def atomic_write(path, write, mode="wb"):
+    """Write a file via write(f) on a temporary sibling, then atomically replace path with it."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class LicenseGeneratorApp:
     def __init__(self, root):
         self.root = root
@@ -47,14 +118,26 @@ class LicenseGeneratorApp:
         self.root.geometry("800x650")
         self.root.minsize(700, 600)
         
-        # Use hardcoded Fernet key
+        # Use hardcoded Fernet key; cryptography is imported here to keep startup light
+        from cryptography.fernet import Fernet
         self.fernet = Fernet(FERNET_KEY)
         
+        # Log lines waiting to be written to the log widget
+        self._log_buf = []
+        self._log_flush_id = None
+        
+        # Decrypted licenses of the last file read, reused while its file_stamp is unchanged
+        self._licenses = {}
+        self._licenses_path = None
+        self._licenses_stamp = None
+        
         # Initialize UI
         self.setup_ui()
         
         # Set default values
         self.set_defaults()
+        
+        self.load_licenses(os.path.normpath(self.output_path_var.get()))
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -184,17 +267,68 @@ class LicenseGeneratorApp:
     def log_message(self, message):
         """Add message to log with timestamp."""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self._log_buf.append(f"[{timestamp}] {message}\n")
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """Write buffered log messages to the log widget in a single update."""
+        self._log_flush_id = None
+        if not self._log_buf:
+            return
+        self.log_text.insert(tk.END, "".join(self._log_buf))
+        self._log_buf.clear()
         self.log_text.see(tk.END)
 
+    def load_licenses(self, path):
+        """Load and decrypt the licenses stored at path, reusing the cached copy if the file is unchanged."""
+        stamp = file_stamp(path)
+        if path == self._licenses_path and stamp == self._licenses_stamp:
+            return self._licenses
+        
+        from cryptography.fernet import InvalidToken
+        
+        licenses = {}
+        if stamp is not None:
+            try:
+                with open(path, "rb") as f:
+                    encrypted_data = json_loads(f.read())
+                    
+                if not isinstance(encrypted_data, dict):
+                    self.log_message("Warning: Could not load existing licenses: file does not contain a JSON object")
+                elif not isinstance(encrypted_data.get("encrypted_licenses", ""), str):
+                    self.log_message("Warning: Could not decrypt existing licenses: encrypted_licenses is not a string")
+                elif "encrypted_licenses" in encrypted_data:
+                    try:
+                        decrypted_data = self.fernet.decrypt(encrypted_data["encrypted_licenses"].encode())
+                        licenses = json_loads(decrypted_data)
+                    except (InvalidToken, ValueError) as e:
+                        self.log_message(f"Warning: Could not decrypt existing licenses: {e}")
+                    if not isinstance(licenses, dict):
+                        self.log_message("Warning: Could not load existing licenses: decrypted data is not a JSON object")
+                        licenses = {}
+                else:
+                    licenses = encrypted_data
+            except (OSError, ValueError) as e:
+                self.log_message(f"Warning: Could not load existing licenses: {e}")
+        
+        self._licenses = licenses
+        self._licenses_path = path
+        self._licenses_stamp = stamp
+        return licenses
+
     def generate_license(self):
         """Generate the license based on input values."""
         try:
             self.status_var.set("Generating license...")
             self.root.update_idletasks()
             
+            now = datetime.datetime.now()
+            now_iso = now.isoformat()
+            issue_date = now.date().isoformat()
+            
             mac_address = self.mac_var.get().strip()
-            if not mac_address or len(mac_address.split(':')) != 6:
+            if not mac_address or not mac_address.isascii() or len(mac_address.split(':')) != 6:
                 messagebox.showerror("Input Error", "Invalid MAC address format. Please use format xx:xx:xx:xx:xx:xx")
                 return
             
@@ -205,7 +339,7 @@ class LicenseGeneratorApp:
             
             expiry_date = self.expiry_var.get().strip()
             try:
-                datetime.datetime.strptime(expiry_date, "%Y-%m-%d")
+                expiry_date = datetime.date.fromisoformat(expiry_date).isoformat()
                 expiry_datetime = f"{expiry_date}T23:59:59"
             except ValueError:
                 messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-DD format.")
@@ -220,7 +354,7 @@ class LicenseGeneratorApp:
             
             try:
                 ensure_directory_exists(output_path)
-            except Exception as e:
+            except OSError as e:
                 self.log_message(f"Error creating directory for {output_path}: {e}")
                 messagebox.showerror("Error", f"Could not create directory: {str(e)}")
                 return
@@ -229,72 +363,51 @@ class LicenseGeneratorApp:
             
             license_data = {
                 "mac_address": mac_address,
-                "machine_id": hashlib.md5(mac_address.encode()).hexdigest(),
+                "machine_id": get_machine_id(mac_address),
                 "customer_name": customer_name,
                 "expiry_date": expiry_datetime,
                 "license_key": license_key,
-                "issue_date": datetime.datetime.now().isoformat()
+                "issue_date": now_iso
             }
             
-            licenses = {}
-            try:
-                if os.path.exists(output_path):
-                    with open(output_path, "r") as f:
-                        encrypted_data = json.load(f)
-                        
-                    if "encrypted_licenses" in encrypted_data:
-                        try:
-                            decrypted_data = self.fernet.decrypt(encrypted_data["encrypted_licenses"].encode())
-                            licenses = json.loads(decrypted_data)
-                        except Exception as e:
-                            self.log_message(f"Warning: Could not decrypt existing licenses: {e}")
-                    else:
-                        licenses = encrypted_data
-            except Exception as e:
-                self.log_message(f"Warning: Could not load existing licenses: {e}")
-            
+            # Work on a copy so a failed save leaves the cached licenses untouched
+            licenses = dict(self.load_licenses(output_path))
             licenses[license_key] = license_data
             
-            encrypted_licenses = self.fernet.encrypt(json.dumps(licenses).encode()).decode()
+            # The payload is only ever read after decryption, so encode it compactly
+            encrypted_licenses = self.fernet.encrypt(json_dumps(licenses)).decode()
             
             output_data = {
                 "encrypted_licenses": encrypted_licenses,
                 "format_version": "1.0",
-                "updated_at": datetime.datetime.now().isoformat()
+                "updated_at": now_iso
             }
             
             try:
-                with open(output_path, "w") as f:
-                    json.dump(output_data, f, indent=2)
-                self.log_message(f"Encrypted license data saved to: {output_path}")
-            except Exception as e:
+                atomic_write(output_path, lambda f: json_dump(output_data, f, indent=True))
+            except OSError as e:
                 self.log_message(f"Error saving license file: {e}")
-                fallback_path = os.path.join(os.getcwd(), "licenses.json")
-                with open(fallback_path, "w") as f:
-                    json.dump(output_data, f, indent=2)
-                self.log_message(f"License saved to fallback location: {fallback_path}")
-                output_path = fallback_path
+                raise
+            self.log_message(f"Encrypted license data saved to: {output_path}")
+            
+            self._licenses = licenses
+            self._licenses_path = output_path
+            self._licenses_stamp = file_stamp(output_path)
             
             customer_filename = f"{customer_name.replace(' ', '_')}_license.txt"
             customer_license_path = os.path.join(os.path.dirname(output_path), customer_filename)
+            customer_license = (
+                f"LICENSE KEY: {license_key}\n"
+                f"Customer: {customer_name}\n"
+                f"Expiry Date: {expiry_date}\n"
+                f"Issue Date: {issue_date}\n"
+            )
             
             try:
-                with open(customer_license_path, "w") as f:
-                    f.write(f"LICENSE KEY: {license_key}\n")
-                    f.write(f"Customer: {customer_name}\n")
-                    f.write(f"Expiry Date: {expiry_date}\n")
-                    f.write(f"Issue Date: {datetime.datetime.now().strftime('%Y-%m-%d')}\n")
-                
+                atomic_write(customer_license_path, lambda f: f.write(customer_license), mode="w")
                 self.log_message(f"Customer license file saved to: {customer_license_path}")
-            except Exception as e:
+            except OSError as e:
                 self.log_message(f"Warning: Could not create customer license file: {e}")
-                customer_fallback_path = os.path.join(os.getcwd(), customer_filename)
-                with open(customer_fallback_path, "w") as f:
-                    f.write(f"LICENSE KEY: {license_key}\n")
-                    f.write(f"Customer: {customer_name}\n")
-                    f.write(f"Expiry Date: {expiry_date}\n")
-                    f.write(f"Issue Date: {datetime.datetime.now().strftime('%Y-%m-%d')}\n")
-                self.log_message(f"Customer license file saved to fallback location: {customer_fallback_path}")
             
             self.license_key_var.set(license_key)
             
@@ -302,7 +415,7 @@ class LicenseGeneratorApp:
             self.license_details.insert(tk.END, f"MAC Address: {mac_address}\n")
             self.license_details.insert(tk.END, f"Customer: {customer_name}\n")
             self.license_details.insert(tk.END, f"Expiry Date: {expiry_date}\n")
-            self.license_details.insert(tk.END, f"Issue Date: {datetime.datetime.now().strftime('%Y-%m-%d')}\n")
+            self.license_details.insert(tk.END, f"Issue Date: {issue_date}\n")
             self.license_details.insert(tk.END, f"Output File: {output_path}\n\n")
             self.license_details.insert(tk.END, "IMPORTANT: Upload this file to your GitHub repository for license verification.")
             
@@ -321,6 +434,7 @@ class LicenseGeneratorApp:
 
 def main():
     try:
+        from ttkthemes import ThemedTk
         root = ThemedTk(theme="arc")
     except Exception:
         root = tk.Tk()